@@ -44,13 +44,13 @@ def demo_alignment_presets():
         organizer.config["grid_layout"]["include_folders"] = True
         
         for category, items in sample_items.items():
-            print(f"\n{category}:")
-            print("-" * (len(category) + 1))
-            
+            # Collect each category's lines and write them in one go
+            lines = [f"\n{category}:", "-" * (len(category) + 1)]
             for index, (item_name, is_folder) in enumerate(items):
                 x, y = organizer.calculate_adaptive_grid_position(category, index, is_folder)
                 folder_indicator = " 📁" if is_folder else " 📄"
-                print(f"  {item_name:<20}{folder_indicator} -> ({x:>4}, {y:>4})")
+                lines.append(f"  {item_name:<20}{folder_indicator} -> ({x:>4}, {y:>4})")
+            print("\n".join(lines))
 
 def demo_folder_options():
     """Demonstrate folder inclusion/exclusion"""
@@ -82,11 +82,12 @@ def demo_folder_options():
         organizer.config["grid_layout"]["alignment"] = "adaptive"
         
         for category, items in sample_items.items():
-            print(f"\n{category}:")
+            lines = [f"\n{category}:"]
             for index, (item_name, is_folder) in enumerate(items):
                 x, y = organizer.calculate_adaptive_grid_position(category, index, is_folder)
                 folder_indicator = " 📁" if is_folder else " 📄"
-                print(f"  {item_name:<15}{folder_indicator} -> ({x:>4}, {y:>4})")
+                lines.append(f"  {item_name:<15}{folder_indicator} -> ({x:>4}, {y:>4})")
+            print("\n".join(lines))
 
 if __name__ == "__main__":
     print("Desktop Grid Alignment & Folder Positioning Demo")
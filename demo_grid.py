@@ -6,6 +6,18 @@ Demo script to visualize grid positioning calculations
 from desktop_organizer import DesktopOrganizer
 from pathlib import Path
 
+def build_position_table(organizer, sample_items):
+    """Calculate the grid position of every sample item once"""
+    positions = {}
+    for category, items in sample_items.items():
+        if organizer.positioner:
+            positions[category] = [organizer.calculate_adaptive_grid_position(category, index)
+                                   for index in range(len(items))]
+        else:
+            # Fallback to basic positioning if no positioner
+            positions[category] = [(50 + index * 100, 50) for index in range(len(items))]
+    return positions
+
 def demo_grid_positions():
     """Demonstrate grid positioning with sample items"""
     
@@ -47,19 +59,16 @@ def demo_grid_positions():
         print(f"Max Columns: {organizer.config['grid_layout']['max_columns']}")
     print()
     
+    # Both views below use the same positions, so calculate them only once
+    positions = build_position_table(organizer, sample_items)
+    
     for category, items in sample_items.items():
-        print(f"{category}:")
-        print("-" * (len(category) + 1))
-        
-        for index, item in enumerate(items):
-            if organizer.positioner:
-                x, y = organizer.calculate_adaptive_grid_position(category, index)
-            else:
-                # Fallback to basic positioning if no positioner
-                x, y = (50 + index * 100, 50)
-            print(f"  {item:<20} -> ({x:>3}, {y:>3})")
-        
-        print()
+        # Collect each category's lines and write them in one go
+        lines = [f"{category}:", "-" * (len(category) + 1)]
+        for item, (x, y) in zip(items, positions[category]):
+            lines.append(f"  {item:<20} -> ({x:>3}, {y:>3})")
+        lines.append("")
+        print("\n".join(lines))
     
     # Visual representation
     print("Visual Grid Layout (approximate):")
@@ -68,30 +77,22 @@ def demo_grid_positions():
     # Create a simple ASCII representation
     grid_visual = {}
     for category, items in sample_items.items():
-        for index, item in enumerate(items):
-            if organizer.positioner:
-                x, y = organizer.calculate_adaptive_grid_position(category, index)
-            else:
-                x, y = (50 + index * 100, 50)
+        for item, (x, y) in zip(items, positions[category]):
             # Normalize to grid cells for display
             grid_x = x // 100
             grid_y = y // 100
-            if grid_y not in grid_visual:
-                grid_visual[grid_y] = {}
-            grid_visual[grid_y][grid_x] = item[:8]  # First 8 chars
+            grid_visual.setdefault(grid_y, {})[grid_x] = item[:8]  # First 8 chars
     
     # Print the grid
     max_y = max(grid_visual.keys()) if grid_visual else 0
     max_x = max(max(row.keys()) for row in grid_visual.values()) if grid_visual else 0
     
+    lines = []
     for y in range(max_y + 1):
-        line = ""
-        for x in range(max_x + 1):
-            if y in grid_visual and x in grid_visual[y]:
-                line += f"{grid_visual[y][x]:<10}"
-            else:
-                line += " " * 10
-        print(line.rstrip())
+        row = grid_visual.get(y, {})
+        line = "".join(f"{row[x]:<10}" if x in row else " " * 10 for x in range(max_x + 1))
+        lines.append(line.rstrip())
+    print("\n".join(lines))
 
 if __name__ == "__main__":
     demo_grid_positions()
\ No newline at end of file
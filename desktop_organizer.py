@@ -5,20 +5,107 @@ Automatically categorizes and organizes files and folders on the desktop
 """
 
 import os
-import shutil
+import sys
+import errno
 import json
 import logging
-from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Set, Optional, Tuple
-import mimetypes
-import urllib.request
+import hashlib
 import re
 import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Set, Optional, Tuple, Union
 import ctypes
 from ctypes import wintypes
 import time
 
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson  # Optional: faster config parsing
+except ImportError:
+    orjson = None
+
+try:
+    import ujson  # Optional: faster config parsing when orjson is missing
+except ImportError:
+    ujson = None
+
+try:
+    import ahocorasick  # Optional: pyahocorasick for single-pass keyword matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import win32com.client  # Optional: resolve shortcuts through the Windows shell
+except ImportError:
+    win32com = None
+
+
+def _loads_json(data: bytes):
+    """Parse JSON bytes with orjson or ujson when available, otherwise the standard library"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+def _intern_keys(value):
+    """Rebuild parsed JSON with interned dict keys, so lookups by literal keys match on identity"""
+    if isinstance(value, dict):
+        return {sys.intern(key): _intern_keys(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_intern_keys(item) for item in value]
+    return value
+
+
+# Icons shown next to listed items, indexed by whether the item is a folder
+ITEM_TYPE_ICONS = ("📄", "📁")
+
+# Shell Link (.lnk) header signature, see [MS-SHLLINK] 2.1
+SHELL_LINK_HEADER_SIZE = 0x4C
+SHELL_LINK_CLSID = bytes.fromhex('0114020000000000c000000000000046')
+ANSI_ENCODING = 'mbcs' if os.name == 'nt' else 'latin-1'
+
+
+def _read_ansiz(data: bytes, offset: int) -> str:
+    """Read a null-terminated ANSI string starting at offset"""
+    end = data.index(b'\x00', offset)
+    return data[offset:end].decode(ANSI_ENCODING, errors='replace')
+
+
+def _read_utf16z(data: bytes, offset: int) -> str:
+    """Read a null-terminated UTF-16LE string starting at offset"""
+    for end in range(offset, len(data) - 1, 2):
+        if data[end] == 0 and data[end + 1] == 0:
+            return data[offset:end].decode('utf-16-le', errors='replace')
+    raise ValueError("Unterminated UTF-16 string in shortcut")
+
+
+# COM objects belong to the thread that created them, so each thread keeps its own shell
+_thread_state = threading.local()
+
+
+def _wscript_shell():
+    """Return this thread's WScript.Shell object, creating it on first use"""
+    shell = getattr(_thread_state, 'wscript_shell', None)
+    if shell is None:
+        shell = _thread_state.wscript_shell = win32com.client.Dispatch("WScript.Shell")
+    return shell
+
+
+def _init_worker_thread():
+    """Initialize COM in worker threads so win32com shortcut lookups keep working there"""
+    try:
+        import pythoncom
+    except ImportError:
+        return
+    pythoncom.CoInitialize()
+
 class WindowsDesktopPositioner:
     """Handle Windows desktop icon positioning using Windows API"""
     
@@ -34,11 +121,26 @@ class WindowsDesktopPositioner:
         self.LVM_SETITEMPOSITION = 4113
         self.LVM_GETITEMCOUNT = 4100
         self.LVM_GETITEMTEXT = 4141
+        self.WM_SETREDRAW = 0x000B
+        self.RDW_INVALIDATE = 0x0001
+        self.RDW_ERASE = 0x0004
+        self.RDW_ALLCHILDREN = 0x0080
+        self.RDW_UPDATENOW = 0x0100
+        self.SMTO_ABORTIFHUNG = 0x0002
+        self.MESSAGE_TIMEOUT_MS = 500
         
         # Get monitor dimensions
         self.monitor_width = self.user32.GetSystemMetrics(0)  # SM_CXSCREEN
         self.monitor_height = self.user32.GetSystemMetrics(1)  # SM_CYSCREEN
         
+        # Desktop ListView handle, looked up on first use
+        self._listview = None
+        
+        # Explorer process handle and a POINT buffer inside it, held only for one batch of position queries
+        self._process = None
+        self._remote_point = None
+        self._remote_listview = None
+        
     def get_monitor_info(self) -> Tuple[int, int]:
         """Get primary monitor dimensions"""
         return (self.monitor_width, self.monitor_height)
@@ -51,10 +153,15 @@ class WindowsDesktopPositioner:
         return (rect.left, rect.top, rect.right - rect.left, rect.bottom - rect.top)
         
     def get_desktop_window(self):
-        """Get handle to the desktop ListView control"""
+        """Get handle to the desktop ListView control, reusing the last one while it is still valid"""
+        # The handle only changes when Explorer restarts, which IsWindow detects
+        if self._listview and self.user32.IsWindow(self._listview):
+            return self._listview
+        
         progman = self.user32.FindWindowW("Progman", "Program Manager")
         def_view = self.user32.FindWindowExW(progman, 0, "SHELLDLL_DefView", None)
         listview = self.user32.FindWindowExW(def_view, 0, "SysListView32", "FolderView")
+        self._listview = listview
         return listview
     
     def get_desktop_icon_count(self):
@@ -69,53 +176,135 @@ class WindowsDesktopPositioner:
         listview = self.get_desktop_window()
         if not listview:
             return (0, 0)
+        with self._remote_buffer(listview) as ready:
+            return self._read_icon_position(listview, item_index) if ready else (0, 0)
+    
+    def get_all_icon_positions(self) -> List[Tuple[int, int]]:
+        """Get positions of all desktop icons, in index order, through one remote buffer"""
+        listview = self.get_desktop_window()
+        if not listview:
+            return []
+        count = self.user32.SendMessageW(listview, self.LVM_GETITEMCOUNT, 0, 0)
+        with self._remote_buffer(listview) as ready:
+            if not ready:
+                return [(0, 0)] * count
+            return [self._read_icon_position(listview, index) for index in range(count)]
+    
+    def _read_icon_position(self, listview, item_index: int) -> Tuple[int, int]:
+        """Query one icon position through the open remote buffer"""
+        # Send message to get item position
+        result = self.user32.SendMessageW(listview, self.LVM_GETITEMPOSITION, item_index, self._remote_point)
+        
+        if result:
+            # Read the result back
+            point = wintypes.POINT()
+            bytes_read = ctypes.c_size_t()
+            self.kernel32.ReadProcessMemory(self._process, self._remote_point, ctypes.byref(point),
+                                            ctypes.sizeof(point), ctypes.byref(bytes_read))
+            return (point.x, point.y)
+        
+        return (0, 0)
+    
+    @contextmanager
+    def _remote_buffer(self, listview):
+        """Hold a remote POINT buffer for one batch of queries and free it afterwards"""
+        # The buffer lives in Explorer, which does not reclaim it when this process exits
+        try:
+            yield self._ensure_remote_buffer(listview)
+        finally:
+            self.close()
+    
+    def _ensure_remote_buffer(self, listview) -> bool:
+        """Open the ListView's process and allocate a POINT buffer in it, once per ListView"""
+        if self._remote_point and self._remote_listview == listview:
+            return True
+        self.close()
         
-        # Allocate memory in the target process
         process_id = wintypes.DWORD()
         self.user32.GetWindowThreadProcessId(listview, ctypes.byref(process_id))
         process = self.kernel32.OpenProcess(0x1F0FFF, False, process_id.value)
-        
         if not process:
-            return (0, 0)
-        
-        # Allocate memory for POINT structure
-        point_size = ctypes.sizeof(wintypes.POINT)
-        remote_point = self.kernel32.VirtualAllocEx(process, None, point_size, 0x1000, 0x40)
+            return False
         
-        try:
-            # Send message to get item position
-            result = self.user32.SendMessageW(listview, self.LVM_GETITEMPOSITION, item_index, remote_point)
-            
-            if result:
-                # Read the result back
-                point = wintypes.POINT()
-                bytes_read = ctypes.c_size_t()
-                self.kernel32.ReadProcessMemory(process, remote_point, ctypes.byref(point), point_size, ctypes.byref(bytes_read))
-                return (point.x, point.y)
-        finally:
-            self.kernel32.VirtualFreeEx(process, remote_point, 0, 0x8000)
+        remote_point = self.kernel32.VirtualAllocEx(process, None, ctypes.sizeof(wintypes.POINT), 0x1000, 0x40)
+        if not remote_point:
             self.kernel32.CloseHandle(process)
+            return False
         
-        return (0, 0)
+        self._process = process
+        self._remote_point = remote_point
+        self._remote_listview = listview
+        return True
+    
+    def close(self):
+        """Free the remote buffer and process handle used to read icon positions"""
+        if self._remote_point:
+            self.kernel32.VirtualFreeEx(self._process, self._remote_point, 0, 0x8000)
+        if self._process:
+            self.kernel32.CloseHandle(self._process)
+        self._process = None
+        self._remote_point = None
+        self._remote_listview = None
+    
+    def __enter__(self):
+        """Use the positioner as a context manager that releases its remote buffer on exit"""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def set_desktop_icon_position(self, item_index: int, x: int, y: int) -> bool:
         """Set position of desktop icon by index"""
         listview = self.get_desktop_window()
         if not listview:
             return False
+        return self._send_item_position(listview, item_index, x, y)
+    
+    def set_desktop_icon_positions(self, positions: List[Tuple[int, int, int]]) -> int:
+        """Set positions of several desktop icons given as (index, x, y), returning how many were set"""
+        listview = self.get_desktop_window()
+        if not listview:
+            return 0
         
+        positioned = 0
+        with self.redraw_suspended():
+            for item_index, x, y in positions:
+                if self._send_item_position(listview, item_index, x, y):
+                    positioned += 1
+        return positioned
+    
+    def _send_item_position(self, listview, item_index: int, x: int, y: int) -> bool:
+        """Send LVM_SETITEMPOSITION without blocking indefinitely on an unresponsive Explorer"""
         # Create position value (MAKELPARAM)
         position = (y << 16) | (x & 0xFFFF)
-        result = self.user32.SendMessageW(listview, self.LVM_SETITEMPOSITION, item_index, position)
-        return result != 0
+        result = ctypes.c_size_t()
+        sent = self.user32.SendMessageTimeoutW(listview, self.LVM_SETITEMPOSITION, item_index, position,
+                                               self.SMTO_ABORTIFHUNG, self.MESSAGE_TIMEOUT_MS,
+                                               ctypes.byref(result))
+        return sent != 0 and result.value != 0
+    
+    @contextmanager
+    def redraw_suspended(self):
+        """Suspend desktop ListView repaints while icons are moved, then repaint it once"""
+        listview = self.get_desktop_window()
+        if not listview:
+            yield
+            return
+        
+        self.user32.SendMessageW(listview, self.WM_SETREDRAW, False, 0)
+        try:
+            yield
+        finally:
+            self.user32.SendMessageW(listview, self.WM_SETREDRAW, True, 0)
+            self.user32.RedrawWindow(listview, None, None, self.RDW_INVALIDATE | self.RDW_UPDATENOW)
     
     def refresh_desktop(self):
         """Refresh the desktop to update icon positions"""
-        self.user32.InvalidateRect(None, None, True)
-        self.user32.UpdateWindow(self.user32.GetDesktopWindow())
-        # Also try F5 refresh
-        desktop = self.user32.GetDesktopWindow()
-        self.user32.PostMessageW(desktop, 0x100, 0x74, 0)  # VK_F5
+        # Repaint only the desktop ListView rather than invalidating every window on screen
+        listview = self.get_desktop_window()
+        if listview:
+            self.user32.RedrawWindow(listview, None, None,
+                                     self.RDW_INVALIDATE | self.RDW_ERASE | self.RDW_ALLCHILDREN | self.RDW_UPDATENOW)
     
     def find_icon_by_name(self, name: str) -> int:
         """Find desktop icon index by name (simplified approach)"""
@@ -131,6 +320,36 @@ class WindowsDesktopPositioner:
 class DesktopOrganizer:
     """Main class for organizing desktop items by purpose"""
     
+    # Extensions shared by many categories, so they only classify together with a keyword
+    KEYWORD_GATED_EXTENSIONS = frozenset(['.exe', '.msi'])
+    
+    # Maximum number of files inspected when classifying a folder by its contents
+    FOLDER_SAMPLE_SIZE = 50
+    
+    # Upper bound on threads used to classify desktop items concurrently
+    MAX_CLASSIFY_WORKERS = 16
+    
+    # Upper bound on threads used to copy items into a backup concurrently
+    MAX_BACKUP_WORKERS = 8
+    
+    # Raw config file contents by path, reused while the file's mtime and size are unchanged
+    _config_file_cache: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+    
+    # Fallback categories for common media and text files that no rule matched
+    FALLBACK_EXTENSION_CATEGORIES = {
+        # Images, videos and audio go to media tools
+        **dict.fromkeys(['.jpg', '.jpeg', '.jpe', '.png', '.gif', '.bmp', '.tif', '.tiff', '.ico',
+                         '.svg', '.webp', '.heic', '.heif', '.avif', '.psd'], 'Media Tools'),
+        **dict.fromkeys(['.mp4', '.m4v', '.mkv', '.avi', '.mov', '.qt', '.wmv', '.flv', '.webm',
+                         '.mpg', '.mpeg', '.ogv'], 'Media Tools'),
+        **dict.fromkeys(['.mp3', '.wav', '.flac', '.aac', '.m4a', '.ogg', '.oga', '.opus', '.wma',
+                         '.aif', '.aiff', '.mid', '.midi', '.3gp'], 'Media Tools'),
+        # Text files might be code
+        **dict.fromkeys(['.txt', '.text', '.md', '.markdown', '.rst', '.csv', '.tsv', '.html', '.htm',
+                         '.css', '.js', '.mjs', '.py', '.c', '.h', '.cc', '.cpp', '.hpp', '.java',
+                         '.sh', '.pl', '.tcl', '.tex', '.ics', '.vcf', '.srt', '.vtt'], 'Coding Tools'),
+    }
+    
     def __init__(self, config_path: Optional[str] = None):
         """Initialize the desktop organizer"""
         self.user_desktop_path = Path.home() / "Desktop"
@@ -138,19 +357,55 @@ class DesktopOrganizer:
         self.desktop_paths = [self.user_desktop_path, self.public_desktop_path]
         self.config_path = config_path or "config.json"
         self.backup_dir = Path("backups")
+        self.classification_cache_path = self.backup_dir / ".classify_cache.json"
+        self._scanned_entries = {}
+        # Shortcut targets don't depend on the category rules, so they outlive lookup table rebuilds
+        self._shortcut_targets = {}
+        self._persisted_shortcut_targets = {}
+        # Next numbered suffix to try per (folder, base name, extension) when names conflict
+        self._name_counters = {}
+        # Normalized names in each destination folder, listed once per run and updated as items move in
+        self._destination_names = {}
+        # Position of each category in grid_layout.category_order, rebuilt when that list is replaced
+        self._indexed_category_order = None
+        self._category_order_index = {}
         self.config = self._load_config()
+        self._build_lookup_tables()
         self._setup_logging()
+        self._load_classification_cache()
         
-        # Initialize desktop positioning if grid layout is enabled
-        self.positioner = None
+        # Set up desktop positioning on first use if grid layout is enabled
+        self._positioner = None
+        self._positioner_message = None
         if self.config.get("grid_layout", {}).get("enabled", False):
-            try:
-                self.positioner = WindowsDesktopPositioner()
-                self.logger.info("Desktop positioning enabled")
-            except Exception as e:
-                self.logger.warning(f"Could not initialize desktop positioning: {e}")
-                self.positioner = None
-        
+            self.request_positioner()
+        
+    @property
+    def positioner(self) -> Optional[WindowsDesktopPositioner]:
+        """Desktop positioner, created on first access once positioning has been requested"""
+        if self._positioner_message is not None:
+            self.init_positioner(self._positioner_message)
+        return self._positioner
+    
+    @positioner.setter
+    def positioner(self, positioner: Optional[WindowsDesktopPositioner]):
+        self._positioner = positioner
+        self._positioner_message = None
+    
+    def request_positioner(self, enabled_message: str = "Desktop positioning enabled"):
+        """Create the desktop positioner when it is first needed, unless one already exists"""
+        if self._positioner is None:
+            self._positioner_message = enabled_message
+    
+    def init_positioner(self, enabled_message: str = "Desktop positioning enabled"):
+        """Create the desktop positioner, leaving positioning disabled if the Windows API is unavailable"""
+        try:
+            self.positioner = WindowsDesktopPositioner()
+            self.logger.info(enabled_message)
+        except Exception as e:
+            self.logger.warning("Could not initialize desktop positioning: %s", e)
+            self.positioner = None
+    
     def _load_config(self) -> Dict:
         """Load configuration from file or create default"""
         default_config = {
@@ -195,23 +450,245 @@ class DesktopOrganizer:
             "ignore_files": [".DS_Store", "Thumbs.db", "desktop.ini"],
             "dry_run": True,
             "create_backup": True,
+            "backup_hardlinks": False,
+            "backup_mode": "full",
             "ask_confirmation": True
         }
         
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r') as f:
-                    config = json.load(f)
+                config = _intern_keys(_loads_json(self._read_config_file()))
                 # Merge with defaults to ensure all keys exist
                 for key, value in default_config.items():
                     if key not in config:
                         config[key] = value
                 return config
-            except (json.JSONDecodeError, IOError) as e:
+            # orjson and ujson decode errors are ValueErrors but not json.JSONDecodeErrors
+            except (ValueError, IOError) as e:
                 logging.warning(f"Error loading config: {e}. Using defaults.")
                 
         return default_config
     
+    def _read_config_file(self) -> bytes:
+        """Read the config file, reusing an earlier read while the file is unchanged"""
+        stat = os.stat(self.config_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cache_key = os.path.abspath(self.config_path)
+        cached = self._config_file_cache.get(cache_key)
+        if cached and cached[0] == signature:
+            return cached[1]
+        
+        with open(self.config_path, 'rb') as f:
+            data = f.read()
+        # Parsing the bytes per instance yields a fresh dict, which is cheaper than deep-copying one
+        DesktopOrganizer._config_file_cache[cache_key] = (signature, data)
+        return data
+    
+    def _build_lookup_tables(self):
+        """Precompute extension and keyword lookup tables from the category rules"""
+        categories = self.config["categories"]
+        # Categories are numbered in config order; bit N of a mask stands for category N,
+        # so the lowest set bit of a mask is always the earliest matching category
+        category_names = tuple(categories)
+        ext_masks = {}
+        keyword_masks = {}
+        keyword_category_ids = {}
+        category_keywords = []
+        for category_id, rules in enumerate(categories.values()):
+            category_bit = 1 << category_id
+            # Normalize once here so matching never has to lowercase the rules again
+            for extension in rules["extensions"]:
+                extension = extension.lower()
+                ext_masks[extension] = ext_masks.get(extension, 0) | category_bit
+            keywords = tuple(keyword.lower() for keyword in rules["keywords"] if keyword)
+            for keyword in keywords:
+                keyword_masks[keyword] = keyword_masks.get(keyword, 0) | category_bit
+                keyword_category_ids.setdefault(keyword, []).append(category_id)
+            if keywords:
+                category_keywords.append(keywords)
+        
+        # An Aho-Corasick automaton finds every keyword occurrence in a single pass over a name
+        keyword_automaton = None
+        keyword_patterns = []
+        if ahocorasick is not None and keyword_masks:
+            keyword_automaton = ahocorasick.Automaton()
+            for keyword in keyword_masks:
+                keyword_automaton.add_word(keyword, keyword)
+            keyword_automaton.make_automaton()
+        else:
+            # Without it, one alternation per category tells in a single scan whether any keyword occurs
+            for keywords in category_keywords:
+                pattern = re.compile("|".join(map(re.escape, keywords)))
+                keyword_patterns.append((keywords, pattern))
+        
+        self._category_names = category_names
+        self._ext_masks = ext_masks
+        self._keyword_masks = keyword_masks
+        self._keyword_category_ids = keyword_category_ids
+        self._keyword_automaton = keyword_automaton
+        self._keyword_patterns = keyword_patterns
+        self._indexed_categories = categories
+        self._classify_file_name = self._make_file_classifier()
+        
+        # Cached classifications are only valid for the rules they were made with; category
+        # order decides shared extensions and score ties, so it is part of the fingerprint
+        rules_json = json.dumps(list(categories.items()), sort_keys=True)
+        self._config_fingerprint = hashlib.sha1(rules_json.encode('utf-8')).hexdigest()
+        self._classification_cache = {}
+        self._persisted_classifications = {}
+    
+    def _make_file_classifier(self):
+        """Build a file classifier specialized to the current lookup tables"""
+        # Bind the tables as closure variables so classifying a file needs no attribute lookups
+        category_names = self._category_names
+        ext_masks = self._ext_masks
+        keyword_masks = self._keyword_masks
+        keyword_category_ids = self._keyword_category_ids
+        gated_extensions = self.KEYWORD_GATED_EXTENSIONS
+        fallback_categories = self.FALLBACK_EXTENSION_CATEGORIES
+        first_category_id = self._first_category_id
+        match_keywords = self._match_keywords
+        
+        def classify_by_rules(display_name: str, file_extension: str, file_name: str) -> str:
+            ext_mask = ext_masks.get(file_extension, 0)
+            
+            # First check by file extension (but be more flexible for common extensions)
+            if ext_mask and file_extension not in gated_extensions:
+                category = category_names[first_category_id(ext_mask)]
+                logger.debug(f"Classified {display_name} as {category} by extension")
+                return category
+            
+            # Score every category that has a keyword occurring in the filename
+            scores = {}
+            matched_keywords = {}
+            matched_mask = 0
+            matched = match_keywords(file_name)
+            for keyword in sorted(matched):
+                score = 1
+                # Give bonus for exact matches or matches at word boundaries
+                if matched[keyword] or keyword == file_name:
+                    score += 0.5
+                matched_mask |= keyword_masks[keyword]
+                for category_id in keyword_category_ids[keyword]:
+                    scores[category_id] = scores.get(category_id, 0) + score
+                    matched_keywords.setdefault(category_id, []).append(keyword)
+            
+            # For common extensions like .exe, require a keyword from the same category
+            gated_mask = ext_mask & matched_mask
+            if gated_mask:
+                category_id = first_category_id(gated_mask)
+                category = category_names[category_id]
+                logger.debug(f"Classified {display_name} as {category} by extension + keyword '{matched_keywords[category_id][0]}'")
+                return category
+            
+            # Then pick the best keyword match in filename (more thorough)
+            best_match = None
+            best_score = 0
+            
+            # Visit categories in config order so earlier categories win ties
+            for category_id in sorted(scores):
+                score = scores[category_id]
+                if score > best_score:
+                    best_score = score
+                    best_match = category_names[category_id]
+                    logger.debug(f"Better match for {display_name}: {best_match} (score: {score}, keywords: {matched_keywords[category_id]})")
+            
+            if best_match and best_score > 0:
+                logger.debug(f"Classified {display_name} as {best_match} by keyword matching (score: {best_score})")
+                return best_match
+            
+            # Try to classify by well-known file type as fallback
+            fallback_category = fallback_categories.get(file_extension)
+            if fallback_category:
+                return fallback_category
+            
+            # Default category for unclassified items
+            logger.debug(f"Could not classify {display_name}, using 'Other'")
+            return 'Other'
+        
+        # The outcome depends only on the lowercased name, so files sharing one (across desktops
+        # or in different folders) are classified once per set of rules
+        categories_by_name = {}
+        
+        def classify_file_name(display_name: str, file_extension: str, file_name: str) -> str:
+            key = (file_name, file_extension)
+            category = categories_by_name.get(key)
+            if category is None:
+                category = categories_by_name[key] = classify_by_rules(display_name, file_extension, file_name)
+            return category
+        
+        return classify_file_name
+    
+    def _ensure_lookup_tables(self):
+        """Rebuild the lookup tables if the categories config was replaced"""
+        if self.config["categories"] is not self._indexed_categories:
+            self._build_lookup_tables()
+    
+    @staticmethod
+    def _first_category_id(mask: int) -> int:
+        """Return the id of the earliest category in a category bitmask"""
+        return (mask & -mask).bit_length() - 1
+    
+    def _match_keywords(self, name: str) -> Dict[str, bool]:
+        """Find every configured keyword in a lowercased name, flagging those next to a space"""
+        matched = {}
+        if self._keyword_automaton is not None:
+            # The automaton reports where each occurrence ends, so the neighbours can be checked directly
+            for end, keyword in self._keyword_automaton.iter(name):
+                if not matched.get(keyword):
+                    start = end - len(keyword) + 1
+                    matched[keyword] = (start > 0 and name[start - 1] == ' ') or name[end + 1:end + 2] == ' '
+            return matched
+        
+        for keywords, pattern in self._keyword_patterns:
+            if pattern.search(name):
+                for keyword in keywords:
+                    if keyword in name:
+                        matched[keyword] = (keyword + ' ') in name or (' ' + keyword) in name
+        return matched
+    
+    def _load_classification_cache(self):
+        """Load classification results persisted by a previous run"""
+        try:
+            with open(self.classification_cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            return
+        # ValueError covers both undecodable bytes and malformed JSON
+        except (ValueError, IOError) as e:
+            self.logger.debug(f"Ignoring unreadable classification cache: {e}")
+            return
+        
+        # A cache of the wrong shape is ignored rather than making every run fail
+        try:
+            targets = {(path, mtime_ns, size): target
+                       for path, (mtime_ns, size, target) in cache.get("targets", {}).items()}
+            if cache.get("config") != self._config_fingerprint:
+                self.logger.debug("Classification cache was built with different categories, ignoring it")
+                items = {}
+            else:
+                items = {(path, mtime_ns, size): category
+                         for path, (mtime_ns, size, category) in cache.get("items", {}).items()}
+        except (AttributeError, TypeError, ValueError) as e:
+            self.logger.debug(f"Ignoring malformed classification cache: {e}")
+            return
+        
+        self._persisted_shortcut_targets.update(targets)
+        self._persisted_classifications.update(items)
+    
+    def save_classification_cache(self):
+        """Persist the classifications and shortcut targets used during this run for the next run"""
+        items = {path: [mtime_ns, size, category]
+                 for (path, mtime_ns, size), category in self._classification_cache.items()}
+        targets = {path: [mtime_ns, size, target]
+                   for (path, mtime_ns, size), target in self._shortcut_targets.items()}
+        try:
+            self.classification_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.classification_cache_path, 'w', encoding='utf-8') as f:
+                json.dump({"config": self._config_fingerprint, "items": items, "targets": targets}, f)
+        except OSError as e:
+            self.logger.debug(f"Could not save classification cache: {e}")
+    
     def _setup_logging(self):
         """Setup logging configuration"""
         log_level = getattr(logging, self.config.get('log_level', 'INFO').upper())
@@ -224,70 +701,173 @@ class DesktopOrganizer:
                 logging.StreamHandler()
             ]
         )
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
     
     def _get_shortcut_target(self, shortcut_path: Path) -> Optional[str]:
-        """Get the target of a Windows shortcut file (.lnk)"""
+        """Get the target of a Windows shortcut file (.lnk), reusing targets of unchanged shortcuts"""
         try:
-            # Try using win32com if available
-            try:
-                import win32com.client
-                shell = win32com.client.Dispatch("WScript.Shell")
-                shortcut = shell.CreateShortCut(str(shortcut_path))
-                return shortcut.Targetpath
-            except ImportError:
-                # Fallback: Basic parsing of .lnk file
-                with open(shortcut_path, 'rb') as f:
-                    content = f.read()
-                    # Look for strings that might be the target path
-                    # This is a simplified approach
-                    strings = []
-                    current_string = b''
-                    for byte in content:
-                        if 32 <= byte <= 126:  # Printable ASCII
-                            current_string += bytes([byte])
-                        else:
-                            if len(current_string) > 10:
-                                strings.append(current_string.decode('ascii', errors='ignore'))
-                            current_string = b''
-                    
-                    # Look for executable paths
-                    for s in strings:
-                        if '.exe' in s.lower() and ('\\' in s or '/' in s):
-                            return s
-                            
+            stat = self._item_stat(shortcut_path)
+        except OSError:
+            return self._read_shortcut_target(shortcut_path)
+        
+        key = (str(shortcut_path), stat.st_mtime_ns, stat.st_size)
+        if key not in self._shortcut_targets:
+            if key in self._persisted_shortcut_targets:
+                self._shortcut_targets[key] = self._persisted_shortcut_targets[key]
+            else:
+                self._shortcut_targets[key] = self._read_shortcut_target(shortcut_path)
+        return self._shortcut_targets[key]
+    
+    def _read_shortcut_target(self, shortcut_path: Path) -> Optional[str]:
+        """Resolve the target of a Windows shortcut file (.lnk)"""
+        try:
+            if win32com is not None:
+                return _wscript_shell().CreateShortCut(str(shortcut_path)).Targetpath
+            
+            # Fallback: parse the Shell Link binary format directly
+            with open(shortcut_path, 'rb') as f:
+                return self._parse_shell_link(f.read())
+                
         except Exception as e:
             self.logger.debug(f"Could not read shortcut {shortcut_path.name}: {e}")
             return None
         return None
     
+    @staticmethod
+    def _parse_shell_link(data: bytes) -> Optional[str]:
+        """Read the target path of a .lnk file following the [MS-SHLLINK] layout"""
+        header_size, clsid, link_flags = struct.unpack_from('<I16sI', data, 0)
+        if header_size != SHELL_LINK_HEADER_SIZE or clsid != SHELL_LINK_CLSID:
+            return None
+        offset = header_size
+        
+        # LinkTargetIDList: a size-prefixed shell item list we don't need
+        if link_flags & 0x01:
+            offset += 2 + struct.unpack_from('<H', data, offset)[0]
+        
+        # LinkInfo: local base path plus common path suffix
+        if link_flags & 0x02:
+            (info_size, info_header_size, info_flags, _, base_offset, _,
+             suffix_offset) = struct.unpack_from('<7I', data, offset)
+            if info_flags & 0x01:
+                if info_header_size >= 0x24:
+                    base_offset, suffix_offset = struct.unpack_from('<2I', data, offset + 0x1C)
+                    read = _read_utf16z
+                else:
+                    read = _read_ansiz
+                return read(data, offset + base_offset) + read(data, offset + suffix_offset)
+            offset += info_size
+        
+        # No local path (e.g. network targets): use the relative path string
+        is_unicode = link_flags & 0x80
+        for flag in (0x04, 0x08):  # HasName, HasRelativePath
+            if link_flags & flag:
+                count = struct.unpack_from('<H', data, offset)[0]
+                offset += 2
+                size = count * 2 if is_unicode else count
+                if flag == 0x08:
+                    value = data[offset:offset + size]
+                    return value.decode('utf-16-le') if is_unicode else value.decode(ANSI_ENCODING, errors='replace')
+                offset += size
+        return None
+    
     def scan_desktop(self) -> List[Path]:
         """Scan desktop and return list of files and folders from both user and public desktops"""
         items = []
-        
-        for desktop_path in self.desktop_paths:
-            if not desktop_path.exists():
-                self.logger.warning(f"Desktop path not found: {desktop_path}")
-                continue
-                
-            self.logger.info(f"Scanning desktop: {desktop_path}")
-            for item in desktop_path.iterdir():
-                if item.name in self.config["ignore_files"]:
-                    continue
-                # Skip folders that are our own organization folders
-                if item.is_dir() and item.name in self.config["categories"].keys():
-                    continue
-                # Also skip common organization folder names
-                if item.is_dir() and item.name in ["Folders", "Other"]:
-                    continue
+        # Keep the directory entries so later checks reuse the type and stat info from the scan
+        self._scanned_entries = {}
+        ignore_files = set(self.config["ignore_files"])
+        # Skip folders that are our own organization folders, including the common fallback ones
+        organization_folders = set(self.config["categories"])
+        organization_folders.update(["Folders", "Other"])
+        
+        # The desktops are listed concurrently since they may live on different volumes
+        if len(self.desktop_paths) < 2:
+            listings = [self._scan_desktop_path(path, ignore_files, organization_folders)
+                        for path in self.desktop_paths]
+        else:
+            with ThreadPoolExecutor(max_workers=len(self.desktop_paths)) as executor:
+                listings = list(executor.map(
+                    lambda path: self._scan_desktop_path(path, ignore_files, organization_folders),
+                    self.desktop_paths))
+        
+        for entries in listings:
+            for entry in entries:
+                item = Path(entry.path)
+                self._scanned_entries[item] = entry
                 items.append(item)
         
         self.logger.info(f"Found {len(items)} items total across all desktop locations")
         return items
     
+    def _scan_desktop_path(self, desktop_path: Path, ignore_files: Set[str],
+                           organization_folders: Set[str]) -> List[os.DirEntry]:
+        """List the entries of one desktop that are candidates for organizing"""
+        # Opening the listing doubles as the existence check, saving a stat per desktop
+        try:
+            entries = os.scandir(desktop_path)
+        except FileNotFoundError:
+            self.logger.warning(f"Desktop path not found: {desktop_path}")
+            return []
+        
+        self.logger.info(f"Scanning desktop: {desktop_path}")
+        with entries:
+            return [entry for entry in entries
+                    if entry.name not in ignore_files
+                    and not (entry.name in organization_folders and entry.is_dir())]
+    
+    def item_is_dir(self, item_path: Path) -> bool:
+        """Check whether an item is a folder, answering from the last scan when possible"""
+        entry = self._scanned_entries.get(item_path)
+        if entry is None:
+            return item_path.is_dir()
+        try:
+            return entry.is_dir()
+        except OSError:
+            return False
+    
+    def _item_stat(self, item_path: Path) -> os.stat_result:
+        """Stat an item, answering from the last scan when possible"""
+        entry = self._scanned_entries.get(item_path)
+        if entry is None:
+            return item_path.stat()
+        return entry.stat()
+    
     def classify_item(self, item_path: Path) -> str:
-        """Classify an item by its purpose/type"""
-        if item_path.is_dir():
+        """Classify an item by its purpose/type, reusing earlier results for unchanged items"""
+        self._ensure_lookup_tables()
+        try:
+            stat = self._item_stat(item_path)
+        except OSError:
+            return self._classify_uncached(item_path)
+        
+        key = (str(item_path), stat.st_mtime_ns, stat.st_size)
+        category = self._classification_cache.get(key)
+        if category is None:
+            # Only entries seen again are carried over, so stale paths drop out of the cache file
+            category = self._persisted_classifications.pop(key, None)
+            if category is None:
+                category = self._classify_uncached(item_path)
+            else:
+                self.logger.debug(f"Using cached classification for {item_path.name}: {category}")
+            self._classification_cache[key] = category
+        return category
+    
+    def classify_items(self, items: List[Path]) -> List[str]:
+        """Classify several items concurrently, returning their categories in the same order"""
+        # Rebuild stale lookup tables up front instead of racing to do it in the workers
+        self._ensure_lookup_tables()
+        if len(items) < 2:
+            return [self.classify_item(item) for item in items]
+        
+        # Classification mostly waits on directory listings and shortcut reads, which release the GIL
+        max_workers = min(self.MAX_CLASSIFY_WORKERS, len(items))
+        with ThreadPoolExecutor(max_workers=max_workers, initializer=_init_worker_thread) as executor:
+            return list(executor.map(self.classify_item, items))
+    
+    def _classify_uncached(self, item_path: Path) -> str:
+        """Classify an item without consulting the classification cache"""
+        if self.item_is_dir(item_path):
             category = self._classify_folder(item_path)
             # Prevent same-named folder nesting (e.g., don't put 'Games' folder inside 'Games' folder)
             if item_path.name == category:
@@ -297,75 +877,29 @@ class DesktopOrganizer:
         else:
             return self._classify_file(item_path)
     
-    def _classify_file(self, file_path: Path) -> str:
+    def _classify_file(self, file_path: Union[Path, str]) -> str:
         """Classify a file by extension and name"""
-        file_extension = file_path.suffix.lower()
-        file_name = file_path.stem.lower()
+        # Split the name the way Path.stem/suffix do, without building their intermediate objects
+        display_name = os.path.basename(file_path)
+        dot = display_name.rfind('.')
+        if 0 < dot < len(display_name) - 1:
+            file_name = display_name[:dot].lower()
+            file_extension = display_name[dot:].lower()
+        else:
+            file_name = display_name.lower()
+            file_extension = ''
         
         # Handle Windows shortcuts specially
         if file_extension == '.lnk':
-            return self._classify_shortcut(file_path)
-        
-        # First check by file extension (but be more flexible for common extensions)
-        for category, rules in self.config["categories"].items():
-            if file_extension in rules["extensions"]:
-                # For common extensions like .exe, also check keywords
-                if file_extension in ['.exe', '.msi']:
-                    # Check if filename contains category keywords
-                    for keyword in rules["keywords"]:
-                        if keyword in file_name:
-                            self.logger.debug(f"Classified {file_path.name} as {category} by extension + keyword '{keyword}'")
-                            return category
-                else:
-                    self.logger.debug(f"Classified {file_path.name} as {category} by extension")
-                    return category
-        
-        # Then check by keywords in filename (more thorough)
-        best_match = None
-        best_score = 0
-        
-        for category, rules in self.config["categories"].items():
-            score = 0
-            matched_keywords = []
-            
-            for keyword in rules["keywords"]:
-                if keyword in file_name:
-                    score += 1
-                    matched_keywords.append(keyword)
-                    
-                    # Give bonus for exact matches or matches at word boundaries
-                    if keyword == file_name or (keyword + ' ') in file_name or (' ' + keyword) in file_name:
-                        score += 0.5
-            
-            if score > best_score:
-                best_score = score
-                best_match = category
-                self.logger.debug(f"Better match for {file_path.name}: {category} (score: {score}, keywords: {matched_keywords})")
+            return self._classify_shortcut(Path(file_path), file_name)
         
-        if best_match and best_score > 0:
-            self.logger.debug(f"Classified {file_path.name} as {best_match} by keyword matching (score: {best_score})")
-            return best_match
-        
-        # Try to classify by MIME type as fallback
-        mime_type, _ = mimetypes.guess_type(str(file_path))
-        if mime_type:
-            main_type = mime_type.split('/')[0]
-            if main_type == 'image':
-                return 'Media Tools'  # Images go to media tools now
-            elif main_type == 'video':
-                return 'Media Tools'
-            elif main_type == 'audio':
-                return 'Media Tools'
-            elif main_type == 'text':
-                return 'Coding Tools'  # Text files might be code
-        
-        # Default category for unclassified items
-        self.logger.debug(f"Could not classify {file_path.name}, using 'Other'")
-        return 'Other'
+        self._ensure_lookup_tables()
+        return self._classify_file_name(display_name, file_extension, file_name)
     
-    def _classify_shortcut(self, shortcut_path: Path) -> str:
+    def _classify_shortcut(self, shortcut_path: Path, shortcut_name: Optional[str] = None) -> str:
         """Classify a Windows shortcut by its name and target"""
-        shortcut_name = shortcut_path.stem.lower()
+        if shortcut_name is None:
+            shortcut_name = shortcut_path.stem.lower()
         
         # Get the shortcut target if possible
         target = self._get_shortcut_target(shortcut_path)
@@ -378,27 +912,30 @@ class DesktopOrganizer:
         
         self.logger.debug(f"Classifying shortcut {shortcut_path.name} (combined name: '{combined_name}')")
         
-        # Check keywords against combined name
+        # Check keywords against combined name, scoring every category in one matching pass
+        self._ensure_lookup_tables()
+        shortcut_words = set(shortcut_name.split())
+        scores = {}
+        matched_keywords = {}
+        for keyword in sorted(self._match_keywords(combined_name)):
+            score = 1
+            # Give bonus for exact matches
+            if keyword == shortcut_name or keyword in shortcut_words:
+                score += 0.5
+            for category_id in self._keyword_category_ids[keyword]:
+                scores[category_id] = scores.get(category_id, 0) + score
+                matched_keywords.setdefault(category_id, []).append(keyword)
+        
         best_match = None
         best_score = 0
         
-        for category, rules in self.config["categories"].items():
-            score = 0
-            matched_keywords = []
-            
-            for keyword in rules["keywords"]:
-                if keyword in combined_name:
-                    score += 1
-                    matched_keywords.append(keyword)
-                    
-                    # Give bonus for exact matches
-                    if keyword == shortcut_name or keyword in shortcut_name.split():
-                        score += 0.5
-            
+        # Visit categories in config order so earlier categories win ties
+        for category_id in sorted(scores):
+            score = scores[category_id]
             if score > best_score:
                 best_score = score
-                best_match = category
-                self.logger.debug(f"Better shortcut match for {shortcut_path.name}: {category} (score: {score}, keywords: {matched_keywords})")
+                best_match = self._category_names[category_id]
+                self.logger.debug(f"Better shortcut match for {shortcut_path.name}: {best_match} (score: {score}, keywords: {matched_keywords[category_id]})")
         
         if best_match and best_score > 0:
             self.logger.debug(f"Classified shortcut {shortcut_path.name} as {best_match} by keyword matching (score: {best_score})")
@@ -413,29 +950,45 @@ class DesktopOrganizer:
         folder_name = folder_path.name.lower()
         
         # Check folder name against keywords
-        for category, rules in self.config["categories"].items():
-            for keyword in rules["keywords"]:
-                if keyword in folder_name:
-                    self.logger.debug(f"Classified folder {folder_path.name} as {category} by keyword '{keyword}'")
-                    return category
+        self._ensure_lookup_tables()
+        matched = self._match_keywords(folder_name)
+        if matched:
+            # The earliest category in config order owning any matched keyword wins
+            matched_mask = 0
+            for keyword in matched:
+                matched_mask |= self._keyword_masks[keyword]
+            category_id = self._first_category_id(matched_mask)
+            category = self._category_names[category_id]
+            keyword = min(keyword for keyword in matched if self._keyword_masks[keyword] >> category_id & 1)
+            self.logger.debug(f"Classified folder {folder_path.name} as {category} by keyword '{keyword}'")
+            return category
         
         # Analyze folder contents to classify
         try:
-            file_types = {}
-            total_files = 0
-            
-            for item in folder_path.iterdir():
-                if item.is_file():
-                    total_files += 1
-                    file_category = self._classify_file(item)
-                    file_types[file_category] = file_types.get(file_category, 0) + 1
+            # scandir entries answer is_file() from the directory listing without a stat per item
+            sample = []
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        sample.append(entry.path)
+                        if len(sample) >= self.FOLDER_SAMPLE_SIZE:
+                            break
             
-            if total_files > 0:
-                # Find the most common file type
-                most_common = max(file_types.items(), key=lambda x: x[1])
-                if most_common[1] / total_files > 0.6:  # If >60% of files are of one type
-                    self.logger.debug(f"Classified folder {folder_path.name} as {most_common[0]} by content analysis")
-                    return most_common[0]
+            # Knowing the sample size up front lets classification stop as soon as the outcome is settled
+            total_files = len(sample)
+            file_types = {}
+            top_count = 0
+            for index, file_path in enumerate(sample):
+                file_category = self._classify_file(file_path)
+                count = file_types.get(file_category, 0) + 1
+                file_types[file_category] = count
+                if count * 5 > total_files * 3:  # If >60% of files are of one type
+                    self.logger.debug(f"Classified folder {folder_path.name} as {file_category} by content analysis")
+                    return file_category
+                # Stop once even the most common type can no longer pass 60% with the files left
+                top_count = max(top_count, count)
+                if (top_count + total_files - index - 1) * 5 <= total_files * 3:
+                    break
         
         except (PermissionError, OSError) as e:
             self.logger.warning(f"Could not analyze folder contents for {folder_path.name}: {e}")
@@ -506,6 +1059,16 @@ class DesktopOrganizer:
         
         return (start_x, start_y, category_spacing_x, category_spacing_y)
     
+    def _get_category_order_index(self, category_order: List[str]) -> Dict[str, int]:
+        """Map each category to its first position in category_order, rebuilding only when the list is replaced"""
+        if category_order is not self._indexed_category_order:
+            index = {}
+            for position, category in enumerate(category_order):
+                index.setdefault(category, position)
+            self._category_order_index = index
+            self._indexed_category_order = category_order
+        return self._category_order_index
+    
     def calculate_adaptive_grid_position(self, category: str, item_index_in_category: int, is_folder: bool = False) -> Tuple[int, int]:
         """Calculate grid position adaptively based on monitor dimensions and alignment settings"""
         if not self.positioner:
@@ -551,11 +1114,8 @@ class DesktopOrganizer:
             margin, categories_per_row, grid_width, grid_height
         )
         
-        # Get category index
-        try:
-            category_index = category_order.index(category)
-        except ValueError:
-            category_index = len(category_order)  # Put unknown categories at the end
+        # Get category index, putting unknown categories at the end
+        category_index = self._get_category_order_index(category_order).get(category, len(category_order))
         
         # Calculate category grid position
         category_row = category_index // categories_per_row
@@ -584,8 +1144,8 @@ class DesktopOrganizer:
         
         return (final_x, final_y)
     
-    def position_desktop_items(self, classifications: Dict[Path, str]):
-        """Position desktop items in a grid layout"""
+    def position_desktop_items(self, items: List[Path], item_categories: List[str]):
+        """Position desktop items in a grid layout, given the items and their categories in parallel lists"""
         if not self.positioner:
             self.logger.warning("Desktop positioning not available")
             return
@@ -594,10 +1154,8 @@ class DesktopOrganizer:
         
         # Group items by category
         categories = {}
-        for item, category in classifications.items():
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(item)
+        for item, category in zip(items, item_categories):
+            categories.setdefault(category, []).append(item)
         
         # Position each item using adaptive grid positioning
         positioned_count = 0
@@ -605,7 +1163,7 @@ class DesktopOrganizer:
             self.logger.debug(f"Positioning {len(items)} items in category: {category}")
             
             for index, item in enumerate(items):
-                is_folder = item.is_dir()
+                is_folder = self.item_is_dir(item)
                 x, y = self.calculate_adaptive_grid_position(category, index, is_folder)
                 
                 # For now, we'll use a simplified approach since finding icons by name is complex
@@ -613,7 +1171,8 @@ class DesktopOrganizer:
                 folder_text = " (folder)" if is_folder else ""
                 self.logger.debug(f"Would position {item.name}{folder_text} at ({x}, {y})")
                 
-                # This is where you'd actually position the icon if we had the icon index
+                # This is where you'd actually position the icon if we had the icon index;
+                # collecting them for set_desktop_icon_positions would move all icons with one repaint
                 # icon_index = self.positioner.find_icon_by_name(item.name)
                 # if icon_index >= 0:
                 #     success = self.positioner.set_desktop_icon_position(icon_index, x, y)
@@ -629,40 +1188,128 @@ class DesktopOrganizer:
                 self.positioner.refresh_desktop()
                 time.sleep(0.5)  # Give time for refresh
     
-    def create_backup(self) -> Path:
-        """Create a backup of the current desktop state"""
+    def create_backup(self, items: Optional[List[Path]] = None) -> Path:
+        """Create a backup of the current desktop state, reusing already scanned items if given"""
         if not self.config["create_backup"]:
             return None
         
+        import shutil
+        
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if items is None:
+            items = self.scan_desktop()
+        
+        # A dry run changes nothing, so recording what is there is enough
+        if self.config["dry_run"] or self.config.get("backup_mode", "full") == "manifest":
+            return self._write_backup_manifest(items, timestamp)
+        
         backup_path = self.backup_dir / f"desktop_backup_{timestamp}"
         backup_path.mkdir(parents=True, exist_ok=True)
         
-        items = self.scan_desktop()
+        # Opt-in hard links preserve the originals against moves without duplicating their data
+        copy_function = self._link_or_copy if self.config.get("backup_hardlinks", False) else shutil.copy2
+        
+        # Items sharing a name (one per desktop) target the same backup path, so keep those in order
+        items_by_name = {}
         for item in items:
-            try:
-                if item.is_dir():
-                    shutil.copytree(item, backup_path / item.name)
-                else:
-                    shutil.copy2(item, backup_path / item.name)
-            except (PermissionError, OSError) as e:
-                self.logger.warning(f"Could not backup {item.name}: {e}")
+            items_by_name.setdefault(item.name, []).append(item)
+        
+        def backup_items(same_name_items):
+            for item in same_name_items:
+                try:
+                    if self.item_is_dir(item):
+                        shutil.copytree(item, backup_path / item.name, copy_function=copy_function)
+                    else:
+                        copy_function(item, backup_path / item.name)
+                except (PermissionError, OSError) as e:
+                    self.logger.warning(f"Could not backup {item.name}: {e}")
+        
+        # Copying is I/O bound and releases the GIL, so independent items are copied concurrently
+        groups = list(items_by_name.values())
+        if len(groups) < 2:
+            for group in groups:
+                backup_items(group)
+        else:
+            max_workers = min(self.MAX_BACKUP_WORKERS, len(groups))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(backup_items, groups))
         
         self.logger.info(f"Backup created at: {backup_path}")
         return backup_path
     
+    def _write_backup_manifest(self, items: List[Path], timestamp: str) -> Path:
+        """Record the paths and metadata of desktop items without copying their contents"""
+        entries = []
+        for item in items:
+            try:
+                stat = self._item_stat(item)
+            except OSError as e:
+                self.logger.warning(f"Could not record {item.name}: {e}")
+                continue
+            entries.append({
+                "source": str(item),
+                "is_dir": self.item_is_dir(item),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns
+            })
+        
+        manifest_path = self.backup_dir / f"backup_manifest_{timestamp}.json"
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        with open(manifest_path, 'w') as f:
+            json.dump({"created": timestamp, "items": entries}, f, indent=2)
+        
+        self.logger.info(f"Backup manifest created at: {manifest_path}")
+        return manifest_path
+    
+    @staticmethod
+    def _link_or_copy(src, dst):
+        """Hard link src to dst, falling back to a full copy where links are not possible"""
+        try:
+            os.link(src, dst)
+        except OSError:
+            # Different volume, unsupported filesystem or insufficient rights
+            import shutil
+            shutil.copy2(src, dst)
+        return dst
+    
     def create_category_folders(self, categories: Set[str]):
         """Create folders for each category on the user desktop"""
         for category in categories:
             category_path = self.user_desktop_path / category
-            if not category_path.exists():
-                try:
-                    category_path.mkdir()
-                    self.logger.info(f"Created folder: {category}")
-                except OSError as e:
-                    self.logger.error(f"Could not create folder {category}: {e}")
-            else:
+            try:
+                category_path.mkdir()
+                self.logger.info(f"Created folder: {category}")
+            except FileExistsError:
                 self.logger.info(f"Using existing folder: {category}")
+            except OSError as e:
+                self.logger.error(f"Could not create folder {category}: {e}")
+    
+    def _get_destination_names(self, folder: Path) -> Set[str]:
+        """Get the normalized names in a destination folder, listing it only on first use"""
+        key = str(folder)
+        names = self._destination_names.get(key)
+        if names is None:
+            try:
+                names = {os.path.normcase(name) for name in os.listdir(folder)}
+            except OSError:
+                # Not created yet, e.g. during a dry run
+                names = set()
+            self._destination_names[key] = names
+        return names
+    
+    def _free_destination_name(self, item_path: Path, destination_folder: Path, existing_names: Set[str]) -> str:
+        """Pick a numbered name for item_path not in existing_names, resuming after the last suffix handed out"""
+        base_name = item_path.stem
+        extension = item_path.suffix
+        counter_key = (str(destination_folder), base_name, extension)
+        counter = self._name_counters.get(counter_key, 1)
+        
+        new_name = f"{base_name}_{counter}{extension}"
+        while os.path.normcase(new_name) in existing_names:
+            counter += 1
+            new_name = f"{base_name}_{counter}{extension}"
+        self._name_counters[counter_key] = counter + 1
+        return new_name
     
     def move_item(self, item_path: Path, category: str) -> bool:
         """Move an item to its category folder on the user desktop"""
@@ -675,7 +1322,7 @@ class DesktopOrganizer:
         destination_path = destination_folder / item_path.name
         
         # Prevent moving a folder into itself (recursive move)
-        if item_path.is_dir() and destination_path.is_relative_to(item_path):
+        if self.item_is_dir(item_path) and destination_path.is_relative_to(item_path):
             self.logger.warning(f"Cannot move folder {item_path.name} into itself")
             return False
         
@@ -685,25 +1332,31 @@ class DesktopOrganizer:
             return True
         
         # Handle name conflicts
-        if destination_path.exists():
-            base_name = item_path.stem
-            extension = item_path.suffix
-            counter = 1
-            
-            while destination_path.exists():
-                if extension:
-                    new_name = f"{base_name}_{counter}{extension}"
-                else:
-                    new_name = f"{base_name}_{counter}"
-                destination_path = destination_folder / new_name
-                counter += 1
+        existing_names = self._get_destination_names(destination_folder)
+        if os.path.normcase(destination_path.name) in existing_names:
+            destination_path = destination_folder / self._free_destination_name(item_path, destination_folder, existing_names)
         
         try:
             if self.config["dry_run"]:
+                existing_names.add(os.path.normcase(destination_path.name))
                 self.logger.info(f"[DRY RUN] Would move: {item_path.name} -> {category}/{destination_path.name}")
                 return True
             else:
-                shutil.move(str(item_path), str(destination_path))
+                # The name set is listed once per run and os.rename replaces files outside Windows,
+                # so make sure nothing has taken the name since
+                while os.path.lexists(destination_path):
+                    existing_names.add(os.path.normcase(destination_path.name))
+                    destination_path = destination_folder / self._free_destination_name(item_path, destination_folder, existing_names)
+                try:
+                    # Both desktops normally share a volume, where a plain rename is all that is needed
+                    os.rename(item_path, destination_path)
+                except OSError as e:
+                    # Only cross-volume moves need shutil's copy and delete; anything else is a real failure
+                    if e.errno != errno.EXDEV:
+                        raise
+                    import shutil
+                    shutil.move(str(item_path), str(destination_path))
+                existing_names.add(os.path.normcase(destination_path.name))
                 self.logger.info(f"Moved: {item_path.name} -> {category}/{destination_path.name}")
                 return True
         except (PermissionError, OSError) as e:
@@ -714,27 +1367,26 @@ class DesktopOrganizer:
         """Main method to organize the desktop"""
         self.logger.info("Starting desktop organization")
         
+        # Destination folders may have changed since a previous run
+        self._destination_names.clear()
+        
         # Scan desktop items
         items = self.scan_desktop()
         if not items:
             self.logger.info("No items found to organize")
             return
         
-        # Classify all items
-        classifications = {}
-        categories_needed = set()
-        
-        for item in items:
-            category = self.classify_item(item)
-            classifications[item] = category
-            categories_needed.add(category)
+        # Classify all items, keeping categories and folder flags in lists parallel to items
+        item_categories = self.classify_items(items)
+        item_is_dirs = [self.item_is_dir(item) for item in items]
+        categories_needed = set(item_categories)
+        self.save_classification_cache()
         
-        # Show classification results
+        # Show classification results, formatted once and written in a single call
         print("\nClassification Results:")
         print("=" * 50)
-        for item, category in classifications.items():
-            item_type = "📁" if item.is_dir() else "📄"
-            print(f"{item_type} {item.name} -> {category}")
+        print("\n".join(f"{ITEM_TYPE_ICONS[is_dir]} {item.name} -> {category}"
+                        for item, category, is_dir in zip(items, item_categories, item_is_dirs)))
         
         # Ask for confirmation if needed
         if self.config["ask_confirmation"]:
@@ -748,7 +1400,7 @@ class DesktopOrganizer:
                 return
         
         # Create backup if enabled
-        backup_path = self.create_backup()
+        backup_path = self.create_backup(items)
         if backup_path:
             print(f"Backup created: {backup_path}")
         
@@ -756,25 +1408,20 @@ class DesktopOrganizer:
         self.create_category_folders(categories_needed)
         
         # Move items to their categories
-        # Process files first, then folders to avoid path conflicts
-        success_count = 0
-        
-        # First pass: move files
-        for item, category in classifications.items():
-            if not item.is_dir():
-                if self.move_item(item, category):
-                    success_count += 1
+        # Plan files first, then folders to avoid path conflicts, and apply the plan in one pass
+        entries = list(zip(items, item_categories, item_is_dirs))
+        move_plan = [(item, category) for item, category, is_dir in entries if not is_dir]
+        move_plan += [(item, category) for item, category, is_dir in entries if is_dir]
         
-        # Second pass: move folders
-        for item, category in classifications.items():
-            if item.is_dir():
-                if self.move_item(item, category):
-                    success_count += 1
+        success_count = 0
+        for item, category in move_plan:
+            if self.move_item(item, category):
+                success_count += 1
         
         # Apply grid positioning if enabled
         if self.config.get("grid_layout", {}).get("enabled", False):
             print("\nApplying grid layout...")
-            self.position_desktop_items(classifications)
+            self.position_desktop_items(items, item_categories)
         
         # Summary
         action = "Would organize" if self.config["dry_run"] else "Organized"
@@ -786,6 +1433,28 @@ class DesktopOrganizer:
         else:
             self.logger.info("Dry run completed. No changes made to desktop.")
 
+# Command line flags that override a config value:
+# (argument, config key path, config value from the argument, info message or None)
+CLI_CONFIG_OVERRIDES = (
+    ("dry_run", ("dry_run",), lambda value: True, None),
+    ("no_backup", ("create_backup",), lambda value: False, None),
+    ("no_confirm", ("ask_confirmation",), lambda value: False, None),
+    ("grid_size", ("grid_layout", "grid_size", "width"), lambda value: value[0], None),
+    ("grid_size", ("grid_layout", "grid_size", "height"), lambda value: value[1], None),
+    ("grid_start", ("grid_layout", "start_position", "x"), lambda value: value[0], None),
+    ("grid_start", ("grid_layout", "start_position", "y"), lambda value: value[1], None),
+    ("align", ("grid_layout", "alignment"), lambda value: value, "Grid alignment set to: %(value)s"),
+    ("include_folders", ("grid_layout", "include_folders"), lambda value: True, "Folder positioning enabled"),
+    ("no_folders", ("grid_layout", "include_folders"), lambda value: False, "Folder positioning disabled"),
+)
+
+
+def _set_config_value(config: Dict, path: Tuple[str, ...], value):
+    """Set a possibly nested config value, creating missing intermediate sections"""
+    for key in path[:-1]:
+        config = config.setdefault(key, {})
+    config[path[-1]] = value
+
 def main():
     """Main entry point"""
     import argparse
@@ -813,85 +1482,53 @@ def main():
     try:
         organizer = DesktopOrganizer(args.config)
         
-        # Override config with command line arguments
-        if args.dry_run:
-            organizer.config["dry_run"] = True
-        if args.no_backup:
-            organizer.config["create_backup"] = False
-        if args.no_confirm:
-            organizer.config["ask_confirmation"] = False
-        
-        # Grid layout options
-        if args.grid:
-            if "grid_layout" not in organizer.config:
-                organizer.config["grid_layout"] = {}
-            organizer.config["grid_layout"]["enabled"] = True
-            # Reinitialize positioner if it wasn't created before
-            if not organizer.positioner:
-                try:
-                    organizer.positioner = WindowsDesktopPositioner()
-                    organizer.logger.info("Desktop positioning enabled via command line")
-                except Exception as e:
-                    organizer.logger.warning(f"Could not initialize desktop positioning: {e}")
-        
-        if args.no_grid:
-            if "grid_layout" not in organizer.config:
-                organizer.config["grid_layout"] = {}
-            organizer.config["grid_layout"]["enabled"] = False
-            organizer.positioner = None
-        
-        if args.grid_size:
-            if "grid_layout" not in organizer.config:
-                organizer.config["grid_layout"] = {}
-            if "grid_size" not in organizer.config["grid_layout"]:
-                organizer.config["grid_layout"]["grid_size"] = {}
-            organizer.config["grid_layout"]["grid_size"]["width"] = args.grid_size[0]
-            organizer.config["grid_layout"]["grid_size"]["height"] = args.grid_size[1]
-        
-        if args.grid_start:
-            if "grid_layout" not in organizer.config:
-                organizer.config["grid_layout"] = {}
-            if "start_position" not in organizer.config["grid_layout"]:
-                organizer.config["grid_layout"]["start_position"] = {}
-            organizer.config["grid_layout"]["start_position"]["x"] = args.grid_start[0]
-            organizer.config["grid_layout"]["start_position"]["y"] = args.grid_start[1]
-        
-        if args.align:
-            if "grid_layout" not in organizer.config:
-                organizer.config["grid_layout"] = {}
-            organizer.config["grid_layout"]["alignment"] = args.align
-            organizer.logger.info(f"Grid alignment set to: {args.align}")
-        
-        if args.include_folders:
-            if "grid_layout" not in organizer.config:
-                organizer.config["grid_layout"] = {}
-            organizer.config["grid_layout"]["include_folders"] = True
-            organizer.logger.info("Folder positioning enabled")
-        
-        if args.no_folders:
-            if "grid_layout" not in organizer.config:
-                organizer.config["grid_layout"] = {}
-            organizer.config["grid_layout"]["include_folders"] = False
-            organizer.logger.info("Folder positioning disabled")
-        
+        # Listing only reads the desktop, so none of the organizing or grid options apply
         if args.list_only:
+            # Classify everything concurrently from the scan's directory entries first, then report
             items = organizer.scan_desktop()
-            print(f"\nFound {len(items)} items on desktop:")
-            for item in items:
-                category = organizer.classify_item(item)
-                item_type = "📁" if item.is_dir() else "📄"
-                print(f"  {item_type} {item.name} -> {category}")
-        else:
-            organizer.organize_desktop()
+            item_categories = organizer.classify_items(items)
+            item_is_dirs = [organizer.item_is_dir(item) for item in items]
+            organizer.save_classification_cache()
             
+            # Format every line first and write them in a single call
+            print(f"\nFound {len(items)} items on desktop:")
+            line_format = "  %s %s -> %s"
+            lines = [line_format % (ITEM_TYPE_ICONS[is_dir], item.name, category)
+                     for item, category, is_dir in zip(items, item_categories, item_is_dirs)]
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+            return 0
+        
+        # Grid layout on/off also manages the positioner, so it is handled apart from the plain overrides
+        # Already enabled in the config means the positioner was requested at construction
+        if args.grid and organizer.config.get("grid_layout", {}).get("enabled") is not True:
+            _set_config_value(organizer.config, ("grid_layout", "enabled"), True)
+            # The positioner is only created once organizing actually needs it
+            organizer.request_positioner("Desktop positioning enabled via command line")
+        
+        # Already disabled means no positioner was requested or created
+        if args.no_grid and organizer.config.get("grid_layout", {}).get("enabled") is not False:
+            _set_config_value(organizer.config, ("grid_layout", "enabled"), False)
+            organizer.positioner = None
+        
+        # Override config with command line arguments, in table order so later flags win
+        for argument, path, convert, message in CLI_CONFIG_OVERRIDES:
+            value = getattr(args, argument)
+            if value:
+                _set_config_value(organizer.config, path, convert(value))
+                if message:
+                    organizer.logger.info(message, {"value": value})
+        
+        organizer.organize_desktop()
+        return 0
+    
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
         return 1
     except Exception as e:
-        logging.error(f"Error organizing desktop: {e}")
+        # End users get a one-line error and a failing exit code rather than a traceback
+        logger.error("Error organizing desktop: %s", e)
         return 1
-    
-    return 0
 
 if __name__ == "__main__":
-    exit(main())
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file